@@ -111,14 +111,31 @@ operator.add((MetaVariable,), car_MetaVariable)
 def cdr_MetaVariable(x):
     """Return the arguments/tail/CDR of a variable object.
 
+    The result is cached on the variable object, so that sub-graphs shared
+    between terms (e.g. in `etuplize`d graphs and during unification) are only
+    decomposed once.  Since the operator and arguments can belong to another
+    object (e.g. a Theano variable's `owner`), the cached CDR is only reused
+    while they are the same objects it was built from.
+
     See `cdr_MetaSymbol`
     """
     try:
-        x_e = etuple(_car(x), *x.base_arguments, eval_obj=x)
+        x_op = _car(x)
+        x_args = x.base_arguments
     except NotImplementedError:
         raise ConsError("Not a cons pair.")
 
-    return x_e[1:]
+    x_cached = getattr(x, "_base_cdr", None)
+
+    if x_cached is not None and x_cached[0] is x_op and x_cached[1] is x_args:
+        return x_cached[2]
+
+    x_e = etuple(x_op, *x_args, eval_obj=x)
+    x_cdr = x_e[1:]
+
+    x._base_cdr = (x_op, x_args, x_cdr)
+
+    return x_cdr
 
 
 # _cdr.add((MetaSymbol,), cdr_MetaSymbol)
@@ -1,5 +1,6 @@
 import abc
 import types
+import inspect
 import reprlib
 
 import numpy as np
@@ -27,6 +28,7 @@ meta_repr.maxother = 100
 meta_repr.print_obj = False
 
 metatize_cache = {}
+meta_op_sig_cache = {}
 
 _auto_reification_disabled = False
 _lvar_defaults_enabled = set()
@@ -401,6 +403,31 @@ def _metatize_MetaSymbol(obj):
     return obj
 
 
+@cached(meta_op_sig_cache)
+def _meta_op_call_sig(op_type):
+    """Get the signature of a meta `Op` type's `__call__` method."""
+    # The partial is just a way to ignore the `self` parameter
+    return inspect.signature(partial(op_type.__call__, None))
+
+
+class MetaOpSignature(object):
+    """A descriptor that provides a cached `__signature__` for meta `Op` instances.
+
+    `inspect.signature` checks for a `__signature__` attribute before it does
+    anything else, so this lets callers (e.g. `ExpressionTuple.eval_obj`)
+    avoid re-deriving the same `__call__` signature every time a meta `Op` is
+    evaluated.
+
+    Class-level access returns `None`, so that `inspect.signature` still
+    reports the constructor signature for the meta `Op` types themselves.
+    """
+
+    def __get__(self, obj, obj_type=None):
+        if obj is None:
+            return None
+        return _meta_op_call_sig(type(obj))
+
+
 class MetaOp(MetaSymbol):
     """A meta object that represents a `MetaVariable`-producing operator.
 
@@ -415,6 +442,8 @@ class MetaOp(MetaSymbol):
 
     __slots__ = ()
 
+    __signature__ = MetaOpSignature()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -440,7 +469,7 @@ class MetaOp(MetaSymbol):
 
 
 class MetaVariable(MetaSymbol):
-    __slots__ = ()
+    __slots__ = ("_base_cdr",)
 
     @property
     @abc.abstractmethod
@@ -496,7 +525,9 @@ def _find_meta_type(obj_type, meta_abs_type):
             # SVD is just the base `TheanoMetaOp.__init__`, which doesn't account for those.
             # To do this correctly, we would need to dynamically metatize the underlying
             # `Op`'s `__init__` and so on.
-            new_type = type(f"Meta{obj_type.__name__}", (obj_cls,), {"base": obj_type})
+            new_type = type(
+                f"Meta{obj_type.__name__}", (obj_cls,), {"base": obj_type, "__slots__": ()}
+            )
 
             return new_type
         else:
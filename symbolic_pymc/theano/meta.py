@@ -105,6 +105,28 @@ class TheanoMetaTensorType(TheanoMetaType):
         super().__init__(obj=obj)
 
 
+def _positional_arity(sig):
+    """Get the range of argument counts for a signature with only positional, non-default parameters.
+
+    Returns `None` when the signature has defaults or keyword-only parameters
+    (i.e. when `Signature.bind` and `BoundArguments.apply_defaults` could
+    produce something other than the positional arguments themselves).
+    """
+    min_args, max_args = 0, 0
+    for param in sig.parameters.values():
+        if param.kind == param.VAR_POSITIONAL:
+            max_args = float("inf")
+        elif (
+            param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+            and param.default is param.empty
+        ):
+            min_args += 1
+            max_args += 1
+        else:
+            return None
+    return min_args, max_args
+
+
 class TheanoMetaOpType(MetaSymbolType):
     def __new__(cls, name, bases, clsdict):
         new_cls = super().__new__(cls, name, bases, clsdict)
@@ -116,6 +138,8 @@ class TheanoMetaOpType(MetaSymbolType):
                 partial(new_cls.base.make_node, None)
             )
 
+        new_cls._op_sig_arity = _positional_arity(new_cls._op_sig)
+
         return new_cls
 
 
@@ -154,7 +178,11 @@ class TheanoMetaOp(MetaOp, TheanoMetaSymbol, metaclass=TheanoMetaOpType):
                 new_type = type(
                     obj_type.__name__,
                     (cls,),
-                    {"base": obj_type, "_op_sig": inspect.signature(obj.make_node)},
+                    {
+                        "base": obj_type,
+                        "_op_sig": inspect.signature(obj.make_node),
+                        "__slots__": (),
+                    },
                 )
 
                 res = super().__new__(new_type)
@@ -215,11 +243,19 @@ class TheanoMetaOp(MetaOp, TheanoMetaSymbol, metaclass=TheanoMetaOpType):
         """
         name = kwargs.pop("name", None)
 
-        # Use the `Op`'s default `make_node` arguments, if any.
-        op_arg_bind = self._op_sig.bind(*args, **kwargs)
-        op_arg_bind.apply_defaults()
-        op_args, op_args_unreified = meta_reify_iter(op_arg_bind.args)
-        op_kwargs, op_kwargs_unreified = meta_reify_iter(op_arg_bind.kwargs)
+        op_arity = self._op_sig_arity
+        if not kwargs and op_arity is not None and op_arity[0] <= len(args) <= op_arity[1]:
+            # There are no defaults or keywords to fill in, so binding would
+            # only reproduce the positional arguments.
+            bound_args, bound_kwargs = args, {}
+        else:
+            # Use the `Op`'s default `make_node` arguments, if any.
+            op_arg_bind = self._op_sig.bind(*args, **kwargs)
+            op_arg_bind.apply_defaults()
+            bound_args, bound_kwargs = op_arg_bind.args, op_arg_bind.kwargs
+
+        op_args, op_args_unreified = meta_reify_iter(bound_args)
+        op_kwargs, op_kwargs_unreified = meta_reify_iter(bound_kwargs)
 
         if not self.obj:
             obj = self.reify()
@@ -259,7 +295,7 @@ class TheanoMetaOp(MetaOp, TheanoMetaSymbol, metaclass=TheanoMetaOpType):
             # Also, `Apply` inputs can't be `None` (they could be
             # `tt.none_type_t()`, though).
 
-            all_args = op_arg_bind.args + tuple(op_arg_bind.kwargs.values())
+            all_args = bound_args + tuple(bound_kwargs.values())
 
             res_apply = TheanoMetaApply(
                 self,
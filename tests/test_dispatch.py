@@ -112,3 +112,44 @@ def test_unify():
 
     with pytest.raises(ConsError):
         rator(a)
+
+
+class SomeOwnedMetaVariable(MetaVariable):
+    __slots__ = ("owner",)
+    base = SomeType
+
+    def __init__(self, owner, obj=None):
+        super().__init__(obj)
+        self.owner = owner
+
+    @property
+    def base_operator(self):
+        return self.owner.op
+
+    @property
+    def base_arguments(self):
+        return self.owner.args
+
+
+def test_cdr_cache():
+
+    op = SomeMetaOp()
+    a = SomeMetaVariable(op, (1, 2))
+
+    # The CDR is cached until a property changes
+    a_cdr = cdr(a)
+    assert cdr(a) is a_cdr
+
+    a.args = (3, 4)
+    assert cdr(a) is not a_cdr
+    assert cdr(a)[0] == 3
+
+    # The cached CDR is also rebuilt when the object providing the arguments
+    # changes, even though the variable's own properties haven't
+    b = SomeOwnedMetaVariable(SomeMetaVariable(op, (1, 2)))
+    b_cdr = cdr(b)
+    assert cdr(b) is b_cdr
+
+    b.owner.args = (5, 6)
+    assert cdr(b) is not b_cdr
+    assert cdr(b)[0] == 5
@@ -1,7 +1,10 @@
 import pytest
+import inspect
 
 import numpy as np
 
+from functools import partial
+
 from symbolic_pymc.utils import HashableNDArray
 from symbolic_pymc.meta import MetaSymbol, MetaOp, metatize
 
@@ -124,6 +127,19 @@ def test_meta_inheritance():
     assert other_mt.__volatile_slots__ == ("_obj", "_hash", "_rands", "_blah", "_bloh")
 
 
+def test_meta_op_signature():
+    some_op_mt = SomeMetaOp(SomeOp())
+
+    op_sig = inspect.signature(some_op_mt)
+
+    assert op_sig == inspect.signature(partial(SomeMetaOp.__call__, None))
+    # The signature is only computed once per meta `Op` type
+    assert inspect.signature(SomeMetaOp()) is op_sig
+
+    # The meta `Op` types themselves should still have a signature
+    assert inspect.signature(SomeMetaOp)
+
+
 def test_meta_str():
 
     some_mt = SomeMetaSymbol()
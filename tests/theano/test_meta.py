@@ -1,4 +1,5 @@
 import pytest
+import inspect
 import numpy as np
 import theano
 import theano.tensor as tt
@@ -18,6 +19,7 @@ from symbolic_pymc.theano.meta import (
     TheanoMetaType,
     TheanoMetaTensorType,
     mt,
+    _positional_arity,
 )
 from symbolic_pymc.theano.utils import graph_equal
 
@@ -65,6 +67,8 @@ def test_metatize():
     assert isinstance(test_obj, MetaSymbol)
     assert test_obj.obj == test_op_tt
     assert test_obj.base == TestOp
+    # Dynamically created meta types shouldn't add an instance `__dict__`
+    assert not hasattr(test_obj, "__dict__")
 
 
 def test_meta_classes():
@@ -126,6 +130,7 @@ def test_meta_classes():
     svd_tt = tt.nlinalg.SVD()(test_mat)
     # First, can we create one from a new base `Op` instance?
     svd_op_mt = mt(tt.nlinalg.SVD())
+    assert not hasattr(svd_op_mt, "__dict__")
     svd_mt = svd_op_mt(test_mat)
 
     assert svd_mt[0].owner.nin == 1
@@ -180,6 +185,55 @@ def test_meta_classes():
     assert const_mt != mt(2)
 
 
+def test_positional_arity():
+    def fixed_args(a, b):
+        pass
+
+    def var_args(*args):
+        pass
+
+    def default_args(a, b=None):
+        pass
+
+    def kwonly_args(*args, size=None):
+        pass
+
+    def var_kwargs(a, **kwargs):
+        pass
+
+    assert _positional_arity(inspect.signature(fixed_args)) == (2, 2)
+    assert _positional_arity(inspect.signature(var_args)) == (0, float("inf"))
+    assert _positional_arity(inspect.signature(default_args)) is None
+    assert _positional_arity(inspect.signature(kwonly_args)) is None
+    assert _positional_arity(inspect.signature(var_kwargs)) is None
+
+
+def test_meta_op_call_binding(monkeypatch):
+    """Make sure skipping `Signature.bind` doesn't change the resulting inputs."""
+    x_lv, y_lv = var(), var()
+
+    for op_mt, args in [
+        (mt.dot, (x_lv, y_lv)),
+        (mt.add, (x_lv, y_lv)),
+        (mt.nlinalg.matrix_inverse, (x_lv,)),
+    ]:
+        assert type(op_mt)._op_sig_arity is not None
+
+        fast_mt = op_mt(*args)
+
+        with monkeypatch.context() as m:
+            # Force the `Signature.bind` path
+            m.setattr(type(op_mt), "_op_sig_arity", None)
+            bind_mt = op_mt(*args)
+
+        assert isinstance(fast_mt.owner, TheanoMetaApply)
+        assert fast_mt.owner.inputs == bind_mt.owner.inputs == args
+
+    # Invalid numbers of arguments are still caught by `Signature.bind`
+    with pytest.raises(TypeError):
+        mt.nlinalg.matrix_inverse(x_lv, y_lv)
+
+
 def test_meta_str():
     assert str(mt.add) == "TheanoMetaElemwise(Elemwise{add,no_inplace})"
 